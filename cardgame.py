@@ -1,5 +1,6 @@
 import random
 import math
+import functools
 import pygame
 from enum import Enum
 
@@ -12,6 +13,10 @@ class Suit(Enum):
     SPADES = "♠"
 
 
+# Suits that are drawn in red
+_RED_SUITS = frozenset({Suit.HEARTS, Suit.DIAMONDS})
+
+
 class Rank(Enum):
     """Enum for card ranks."""
     ACE = "A"
@@ -32,12 +37,21 @@ class Rank(Enum):
 class Card:
     """Represents a single playing card."""
     
+    __slots__ = ('suit', 'rank', '_repr')
+    
     def __init__(self, suit: Suit, rank: Rank):
         self.suit = suit
         self.rank = rank
+        self._repr = rank.value + suit.value
     
     def __repr__(self):
-        return f"{self.rank.value}{self.suit.value}"
+        return self._repr
+    
+    __str__ = __repr__
+
+
+# Cards are never modified, so every deck shares this one set of 52 cards
+_ALL_CARDS = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
 
 
 class Deck:
@@ -49,10 +63,8 @@ class Deck:
         self._initialize_deck()
     
     def _initialize_deck(self):
-        """Create all 52 cards and shuffle the deck."""
-        for suit in Suit:
-            for rank in Rank:
-                self.cards.append(Card(suit, rank))
+        """Fill the deck with all 52 cards and shuffle it."""
+        self.cards = list(_ALL_CARDS)
         random.shuffle(self.cards)
     
     def draw_card(self):
@@ -75,9 +87,29 @@ class Deck:
         self._initialize_deck()
 
 
+@functools.lru_cache(maxsize=None)
+def _ease_table(duration):
+    """Return the ease-out cubic progress for every frame of an animation."""
+    # Use ease-out cubic for smooth deceleration
+    return tuple(1 - ((1 - elapsed / duration) ** 3) for elapsed in range(duration + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _flip_table(duration, to_deck):
+    """Return the flip angle for every frame of an animation."""
+    if to_deck:
+        # Flip effect: start at 0 degrees (front), flip to 180 degrees (back)
+        return tuple((elapsed / duration) * 180 for elapsed in range(duration + 1))
+    # Flip effect: start at 180 degrees (back), flip to 0 degrees (front)
+    return tuple(180 - (elapsed / duration) * 180 for elapsed in range(duration + 1))
+
+
 class AnimatedCard:
     """Represents a card being animated from deck to player hand."""
     
+    __slots__ = ('card', 'start_x', 'start_y', 'end_x', 'end_y', 'duration', 'elapsed', 'flip_angle', 'to_deck',
+                 '_dx', '_dy', '_ease', '_flips')
+    
     def __init__(self, card, start_x, start_y, end_x, end_y, duration=30, to_deck=False):
         self.card = card
         self.start_x = start_x
@@ -87,6 +119,10 @@ class AnimatedCard:
         self.duration = duration
         self.elapsed = 0
         self.to_deck = to_deck
+        self._dx = end_x - start_x
+        self._dy = end_y - start_y
+        self._ease = _ease_table(duration)
+        self._flips = _flip_table(duration, to_deck)
         
         # If card is going to deck, start at 0° (front), end at 180° (back)
         # If card is coming from deck, start at 180° (back), end at 0° (front)
@@ -98,12 +134,7 @@ class AnimatedCard:
     def update(self):
         """Update animation progress."""
         self.elapsed += 1
-        if self.to_deck:
-            # Flip effect: start at 0 degrees (front), flip to 180 degrees (back)
-            self.flip_angle = (self.elapsed / self.duration) * 180
-        else:
-            # Flip effect: start at 180 degrees (back), flip to 0 degrees (front)
-            self.flip_angle = 180 - (self.elapsed / self.duration) * 180
+        self.flip_angle = self._flips[min(self.elapsed, self.duration)]
     
     def is_complete(self):
         """Check if animation is complete."""
@@ -111,23 +142,21 @@ class AnimatedCard:
     
     def get_position(self):
         """Get current position using easing."""
-        progress = self.elapsed / self.duration
-        # Use ease-out cubic for smooth deceleration
-        eased_progress = 1 - ((1 - progress) ** 3)
-        x = self.start_x + (self.end_x - self.start_x) * eased_progress
-        y = self.start_y + (self.end_y - self.start_y) * eased_progress
-        return x, y
+        eased_progress = self._ease[min(self.elapsed, self.duration)]
+        return self.start_x + self._dx * eased_progress, self.start_y + self._dy * eased_progress
 
 
 # Example usage
 if __name__ == "__main__":
+    from pygame._sdl2 import video
+    
     pygame.init()
     
-    # Screen setup
+    # Screen setup - draw through the hardware accelerated SDL2 renderer
     SCREEN_WIDTH = 1000
     SCREEN_HEIGHT = 700
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Card Game")
+    window = video.Window("Card Game", size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = video.Renderer(window)
     clock = pygame.time.Clock()
     
     # Colors
@@ -156,20 +185,35 @@ if __name__ == "__main__":
     CARD_WIDTH = 60
     CARD_HEIGHT = 90
     
+    # Player hand position on screen, precomputed for the usual hand sizes
+    PLAYER_Y = 200
+    PLAYER_SLOT_XS = tuple(50 + i * 70 for i in range(52))
+    
+    def player_slot_x(slot):
+        """Return the x position of the given slot in the player hand."""
+        if slot < len(PLAYER_SLOT_XS):
+            return PLAYER_SLOT_XS[slot]
+        return 50 + slot * 70
+    
     # Button class
     class Button:
+        __slots__ = ('rect', 'text', 'hovered', 'text_texture', 'text_rect')
+        
         def __init__(self, x, y, width, height, text):
             self.rect = pygame.Rect(x, y, width, height)
             self.text = text
             self.hovered = False
+            self.text_texture = video.Texture.from_surface(renderer, font_small.render(text, True, WHITE))
+            self.text_rect = self.text_texture.get_rect(center=self.rect.center)
         
-        def draw(self, surface):
-            color = (100, 150, 100) if self.hovered else (70, 130, 70)
-            pygame.draw.rect(surface, color, self.rect)
-            pygame.draw.rect(surface, WHITE, self.rect, 2)
-            text_surface = font_small.render(self.text, True, WHITE)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            surface.blit(text_surface, text_rect)
+        def draw(self):
+            renderer.draw_color = pygame.Color(100, 150, 100) if self.hovered else pygame.Color(70, 130, 70)
+            renderer.fill_rect(self.rect)
+            # Two one-pixel outlines make the 2 pixel border
+            renderer.draw_color = pygame.Color(WHITE)
+            renderer.draw_rect(self.rect)
+            renderer.draw_rect(self.rect.inflate(-2, -2))
+            self.text_texture.draw(dstrect=self.text_rect)
         
         def is_clicked(self, pos):
             return self.rect.collidepoint(pos)
@@ -189,83 +233,174 @@ if __name__ == "__main__":
     shuffling = False
     shuffle_time = 0
     
-    def draw_card_visual(surface, x, y, card=None, flip_angle=0):
-        """Draw a card at the given position with optional flip animation."""
-        card_rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
+    def render_card_back():
+        """Render the decorative back of a card onto a new surface."""
+        card_surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
+        card_surface.fill(DARK_BLUE)
+        
+        # Draw border
+        pygame.draw.rect(card_surface, LIGHT_BLUE, card_surface.get_rect(), 2)
         
-        # Create a surface for the card
+        # Draw decorative diamond pattern
+        diamond_size = 8
+        for row in range(0, CARD_HEIGHT + diamond_size, diamond_size * 2):
+            for col in range(0, CARD_WIDTH + diamond_size, diamond_size * 2):
+                # Calculate points for a diamond shape
+                points = [
+                    (col + diamond_size // 2, row),
+                    (col + diamond_size, row + diamond_size // 2),
+                    (col + diamond_size // 2, row + diamond_size),
+                    (col, row + diamond_size // 2)
+                ]
+                pygame.draw.polygon(card_surface, (80, 120, 180), points, 1)
+        
+        # Draw center design
+        center_x, center_y = CARD_WIDTH // 2, CARD_HEIGHT // 2
+        pygame.draw.circle(card_surface, (100, 150, 200), (center_x, center_y), 8, 2)
+        
+        # Draw border
+        pygame.draw.rect(card_surface, BLACK, card_surface.get_rect(), 2)
+        return card_surface
+    
+    def render_card_face(card):
+        """Render the front of the given card onto a new surface."""
         card_surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
+        card_surface.fill(WHITE)
         
-        if flip_angle > 90:
-            # Back of card - draw decorative pattern
-            card_surface.fill(DARK_BLUE)
-            
-            # Draw border
-            pygame.draw.rect(card_surface, LIGHT_BLUE, card_surface.get_rect(), 2)
-            
-            # Draw decorative diamond pattern
-            diamond_size = 8
-            for row in range(0, CARD_HEIGHT + diamond_size, diamond_size * 2):
-                for col in range(0, CARD_WIDTH + diamond_size, diamond_size * 2):
-                    # Calculate points for a diamond shape
-                    points = [
-                        (col + diamond_size // 2, row),
-                        (col + diamond_size, row + diamond_size // 2),
-                        (col + diamond_size // 2, row + diamond_size),
-                        (col, row + diamond_size // 2)
-                    ]
-                    pygame.draw.polygon(card_surface, (80, 120, 180), points, 1)
-            
-            # Draw center design
-            center_x, center_y = CARD_WIDTH // 2, CARD_HEIGHT // 2
-            pygame.draw.circle(card_surface, (100, 150, 200), (center_x, center_y), 8, 2)
+        # Determine card color based on suit
+        if card.suit in _RED_SUITS:
+            card_color = RED
         else:
-            # Front of card
-            card_surface.fill(WHITE)
-            if card:
-                # Determine card color based on suit
-                if card.suit in [Suit.HEARTS, Suit.DIAMONDS]:
-                    card_color = RED
-                else:
-                    card_color = BLACK
-                
-                # Draw card text
-                card_text = font_card.render(str(card), True, card_color)
-                text_rect = card_text.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
-                card_surface.blit(card_text, text_rect)
+            card_color = BLACK
+        
+        # Draw card text
+        card_text = font_card.render(str(card), True, card_color)
+        text_rect = card_text.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
+        card_surface.blit(card_text, text_rect)
         
         # Draw border
         pygame.draw.rect(card_surface, BLACK, card_surface.get_rect(), 2)
-        
-        # Apply flip animation by scaling width
-        flip_angle_rad = flip_angle * math.pi / 180
+        return card_surface
+    
+    # Pre-render every card face and the card back once and upload them as
+    # textures, so drawing a card each frame is a single texture copy
+    CARD_TEXTURE_CACHE = {
+        (suit, rank): video.Texture.from_surface(renderer, render_card_face(Card(suit, rank)))
+        for suit in Suit
+        for rank in Rank
+    }
+    CARD_BACK_TEXTURE = video.Texture.from_surface(renderer, render_card_back())
+    
+    # Pre-render the deck shadow for the 3D effect into a single texture
+    deck_shadow_surface = pygame.Surface((CARD_WIDTH + 4, CARD_HEIGHT + 4), pygame.SRCALPHA)
+    for i in range(1, 4):
+        pygame.draw.rect(deck_shadow_surface, BLACK, (i, i, CARD_WIDTH, CARD_HEIGHT), 1)
+    DECK_SHADOW_TEXTURE = video.Texture.from_surface(renderer, deck_shadow_surface)
+    
+    # The small card that spins inside the deck while shuffling; the renderer
+    # rotates it. Spin angles are always multiples of SPIN_STEP degrees.
+    SPIN_STEP = 5
+    spin_card_surface = pygame.Surface((CARD_WIDTH // 2, CARD_HEIGHT // 2), pygame.SRCALPHA)
+    pygame.draw.rect(spin_card_surface, (100, 150, 200, 150), spin_card_surface.get_rect())
+    pygame.draw.rect(spin_card_surface, LIGHT_BLUE, spin_card_surface.get_rect(), 1)
+    SPIN_TEXTURE = video.Texture.from_surface(renderer, spin_card_surface)
+    # Offset of each spinning card from the deck centre, per spin angle
+    SPIN_OFFSETS = [
+        (int(math.cos(angle * math.pi / 180) * 8), int(math.sin(angle * math.pi / 180) * 8))
+        for angle in range(0, 360, SPIN_STEP)
+    ]
+    
+    # Deck shake offsets while shuffling, indexed by shuffle time
+    SHAKE_PERIOD = 1024
+    SHAKE_OFFSETS = [
+        (int(math.sin(t * 0.3) * 4), int(math.cos(t * 0.3) * 4))
+        for t in range(SHAKE_PERIOD)
+    ]
+    
+    # Number of distinct frames in a card flip (matches the animation duration)
+    FLIP_STEPS = 30
+    
+    # Card width and x offset for every frame of the flip animation; the
+    # renderer scales the card texture to this width
+    FLIP_WIDTHS = []
+    for i in range(FLIP_STEPS + 1):
+        flip_angle_rad = (i / FLIP_STEPS * 180) * math.pi / 180
         scaled_width = int(CARD_WIDTH * abs(math.cos(flip_angle_rad)))
+        if scaled_width > 0:
+            FLIP_WIDTHS.append((scaled_width, (CARD_WIDTH - scaled_width) // 2))
+        else:
+            FLIP_WIDTHS.append((0, CARD_WIDTH // 2))
+    
+    # The title never changes, so render it once
+    TITLE_TEXTURE = video.Texture.from_surface(renderer, font_large.render("Card Game", True, WHITE))
+    TITLE_POS = (SCREEN_WIDTH // 2 - TITLE_TEXTURE.width // 2, 20)
+    
+    @functools.lru_cache(maxsize=32)
+    def render_message(text):
+        """Render a status message, cached per message string."""
+        return video.Texture.from_surface(renderer, font_small.render(text, True, WHITE))
+    
+    @functools.lru_cache(maxsize=64)
+    def render_deck_text(count):
+        """Render the deck size label, cached per card count."""
+        return video.Texture.from_surface(renderer, font_small.render(f"Deck: {count}", True, WHITE))
+    
+    @functools.lru_cache(maxsize=64)
+    def render_player_text(count):
+        """Render the player hand label, cached per card count."""
+        return video.Texture.from_surface(renderer, font_small.render(f"Your cards ({count}):", True, WHITE))
+    
+    def draw_card_visual(x, y, card=None, flip_angle=0):
+        """Draw a card at the given position with optional flip animation.
+        
+        The back of the card is shown when no card is given.
+        """
+        flip_frame = round(flip_angle / 180 * FLIP_STEPS)
+        if card is None:
+            texture = CARD_BACK_TEXTURE
+            flip_frame = FLIP_STEPS
+        elif flip_frame > FLIP_STEPS // 2:
+            texture = CARD_BACK_TEXTURE
+        else:
+            texture = CARD_TEXTURE_CACHE[(card.suit, card.rank)]
         
+        scaled_width, x_offset = FLIP_WIDTHS[flip_frame]
         if scaled_width > 0:
-            flipped_surface = pygame.transform.scale(card_surface, (scaled_width, CARD_HEIGHT))
-            surface.blit(flipped_surface, (x + (CARD_WIDTH - scaled_width) // 2, y))
+            texture.draw(dstrect=(int(x) + x_offset, int(y), scaled_width, CARD_HEIGHT))
         else:
-            # Card is flipping, show back
-            back_surface = pygame.Surface((1, CARD_HEIGHT))
-            back_surface.fill(DARK_GREEN)
-            surface.blit(back_surface, (x + CARD_WIDTH // 2, y))
+            # Card is edge-on, show a thin sliver
+            renderer.draw_color = pygame.Color(DARK_GREEN)
+            renderer.fill_rect((int(x) + x_offset, int(y), 1, CARD_HEIGHT))
+    
+    # Only redraw the screen when something visible has changed
+    dirty = True
+    
+    # Track the mouse from motion events instead of polling it every frame
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED])
+    mouse_pos = pygame.mouse.get_pos()
+    prev_mouse_pos = None
     
     while running:
         clock.tick(60)
-        mouse_pos = pygame.mouse.get_pos()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = True
+            elif event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = event.pos
+                dirty = True
                 if draw_button.is_clicked(mouse_pos):
                     card = deck.draw_card()
                     if card:
                         # Calculate end position for the card
-                        card_x = 50 + (len(player_cards) + len(animated_cards)) * 70
-                        card_y = 200
+                        card_x = player_slot_x(len(player_cards) + len(animated_cards))
                         # Create animation
-                        anim = AnimatedCard(card, DECK_X, DECK_Y, card_x, card_y, duration=30)
+                        anim = AnimatedCard(card, DECK_X, DECK_Y, card_x, PLAYER_Y, duration=30)
                         animated_cards.append(anim)
                         message = f"You drew: {card}"
                     else:
@@ -276,9 +411,7 @@ if __name__ == "__main__":
                     shuffling = True
                     shuffle_time = 0
                     for i, card in enumerate(player_cards):
-                        card_x = 50 + i * 70
-                        card_y = 200
-                        anim = AnimatedCard(card, card_x, card_y, DECK_X, DECK_Y, duration=30, to_deck=True)
+                        anim = AnimatedCard(card, player_slot_x(i), PLAYER_Y, DECK_X, DECK_Y, duration=30, to_deck=True)
                         animated_cards.append(anim)
                     player_cards = []
                     message = "Shuffling cards back to deck..."
@@ -287,104 +420,117 @@ if __name__ == "__main__":
                     running = False
         
         # Update animations
-        for anim in animated_cards[:]:
+        if animated_cards:
+            dirty = True
+        # Rebuild the list in one pass rather than removing finished animations
+        survivors = []
+        returned_to_deck = False
+        for anim in animated_cards:
             anim.update()
             if anim.to_deck:
                 shuffle_time += 1
             if anim.is_complete():
                 if anim.to_deck:
                     # Card animation returning to deck is complete
-                    # Check if all animations are done
-                    if all(a.is_complete() for a in animated_cards):
-                        # All cards returned, reset deck
-                        deck.reset()
-                        shuffling = False
-                        message = "Deck reshuffled! Cards returned to deck."
-                        message_timer = 120
+                    returned_to_deck = True
                 else:
                     # Card animation from deck is complete, add to player hand
                     player_cards.append(anim.card)
-                animated_cards.remove(anim)
+            else:
+                survivors.append(anim)
+        animated_cards = survivors
         
-        # Update button hover states
-        draw_button.update_hover(mouse_pos)
-        reshuffle_button.update_hover(mouse_pos)
-        quit_button.update_hover(mouse_pos)
+        # Check if all animations are done
+        if returned_to_deck and not animated_cards:
+            # All cards returned, reset deck
+            deck.reset()
+            shuffling = False
+            message = "Deck reshuffled! Cards returned to deck."
+            message_timer = 120
+        
+        # Update button hover states, only when the mouse has moved
+        if mouse_pos != prev_mouse_pos:
+            prev_mouse_pos = mouse_pos
+            hover_states = (draw_button.hovered, reshuffle_button.hovered, quit_button.hovered)
+            draw_button.update_hover(mouse_pos)
+            reshuffle_button.update_hover(mouse_pos)
+            quit_button.update_hover(mouse_pos)
+            if hover_states != (draw_button.hovered, reshuffle_button.hovered, quit_button.hovered):
+                dirty = True
         
         # Decrease message timer
         if message_timer > 0:
             message_timer -= 1
+            if message_timer == 0:
+                # Message just disappeared
+                dirty = True
+        
+        # Skip rendering entirely when the frame is unchanged
+        if not dirty:
+            continue
+        dirty = False
         
         # Draw everything
-        screen.fill(GREEN)
+        renderer.draw_color = pygame.Color(GREEN)
+        renderer.clear()
         
         # Title
-        title = font_large.render("Card Game", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 20))
+        TITLE_TEXTURE.draw(dstrect=TITLE_POS)
         
         # Deck info and visual
-        deck_text = font_small.render(f"Deck: {deck.cards_remaining()}", True, WHITE)
-        screen.blit(deck_text, (DECK_X - 20, DECK_Y + CARD_HEIGHT + 10))
+        deck_text = render_deck_text(deck.cards_remaining())
+        deck_text.draw(dstrect=(DECK_X - 20, DECK_Y + CARD_HEIGHT + 10))
         
         # Calculate shake offset when shuffling
         shake_offset_x = 0
         shake_offset_y = 0
         if shuffling and animated_cards:
             # Shake the deck based on shuffle time
-            shake_offset_x = int(math.sin(shuffle_time * 0.3) * 4)
-            shake_offset_y = int(math.cos(shuffle_time * 0.3) * 4)
+            shake_offset_x, shake_offset_y = SHAKE_OFFSETS[shuffle_time % SHAKE_PERIOD]
         
         # Draw deck visual
         deck_x_offset = DECK_X + shake_offset_x
         deck_y_offset = DECK_Y + shake_offset_y
-        draw_card_visual(screen, deck_x_offset, deck_y_offset, card=None, flip_angle=180)
+        draw_card_visual(deck_x_offset, deck_y_offset, card=None, flip_angle=180)
         
         # Draw spinning cards inside deck during shuffle
         if shuffling and animated_cards:
             for i in range(3):
-                spin_angle = (shuffle_time * (i + 1) * 5) % 360
-                spin_x = deck_x_offset + CARD_WIDTH // 2 + int(math.cos(spin_angle * math.pi / 180) * 8)
-                spin_y = deck_y_offset + CARD_HEIGHT // 2 + int(math.sin(spin_angle * math.pi / 180) * 8)
-                
-                # Create a temporary surface for the spinning card
-                temp_surface = pygame.Surface((CARD_WIDTH // 2, CARD_HEIGHT // 2), pygame.SRCALPHA)
-                pygame.draw.rect(temp_surface, (100, 150, 200, 150), temp_surface.get_rect())
-                pygame.draw.rect(temp_surface, LIGHT_BLUE, temp_surface.get_rect(), 1)
+                spin_index = (shuffle_time * (i + 1)) % len(SPIN_OFFSETS)
+                spin_dx, spin_dy = SPIN_OFFSETS[spin_index]
+                spin_x = deck_x_offset + CARD_WIDTH // 2 + spin_dx
+                spin_y = deck_y_offset + CARD_HEIGHT // 2 + spin_dy
                 
-                # Rotate the card
-                rotated = pygame.transform.rotate(temp_surface, spin_angle)
-                rotated_rect = rotated.get_rect(center=(spin_x, spin_y))
-                screen.blit(rotated, rotated_rect)
+                # Rotate the card counter-clockwise around its centre
+                spin_rect = SPIN_TEXTURE.get_rect(center=(spin_x, spin_y))
+                SPIN_TEXTURE.draw(dstrect=spin_rect, angle=-spin_index * SPIN_STEP)
         
         # Draw deck shadow for 3D effect
-        for i in range(1, 4):
-            pygame.draw.rect(screen, BLACK, (deck_x_offset + i, deck_y_offset + i, CARD_WIDTH, CARD_HEIGHT), 1)
+        DECK_SHADOW_TEXTURE.draw(dstrect=(deck_x_offset, deck_y_offset))
         
         # Player cards
-        player_text = font_small.render(f"Your cards ({len(player_cards)}):", True, WHITE)
-        screen.blit(player_text, (50, 150))
+        player_text = render_player_text(len(player_cards))
+        player_text.draw(dstrect=(50, 150))
         
         # Display player cards in a row
-        card_x = 50
         for i, card in enumerate(player_cards):
-            draw_card_visual(screen, card_x, 200, card)
-            card_x += 70
+            draw_card_visual(player_slot_x(i), PLAYER_Y, card)
         
         # Draw animated cards
         for anim in animated_cards:
             x, y = anim.get_position()
-            draw_card_visual(screen, x, y, anim.card, anim.flip_angle)
+            draw_card_visual(x, y, anim.card, anim.flip_angle)
         
         # Message display
         if message_timer > 0:
-            msg_surface = font_small.render(message, True, WHITE)
-            screen.blit(msg_surface, (50, 350))
+            msg_texture = render_message(message)
+            msg_texture.draw(dstrect=(50, 350))
         
         # Draw buttons
-        draw_button.draw(screen)
-        reshuffle_button.draw(screen)
-        quit_button.draw(screen)
+        draw_button.draw()
+        reshuffle_button.draw()
+        quit_button.draw()
         
-        pygame.display.flip()
+        renderer.present()
     
-    pygame.quit()
\ No newline at end of file
+    pygame.quit()
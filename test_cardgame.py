@@ -1,7 +1,7 @@
 """Unit tests for the card game."""
 import unittest
 from unittest.mock import Mock
-from cardgame import Card, Deck, Suit, Rank
+from cardgame import AnimatedCard, Card, Deck, Suit, Rank
 
 
 class TestCard(unittest.TestCase):
@@ -67,6 +67,15 @@ class TestDeck(unittest.TestCase):
         deck.reset()
         self.assertEqual(deck.cards_remaining(), 52)
     
+    def test_reset_deck_contains_all_cards(self):
+        """Test that a reset deck contains all 52 unique cards again."""
+        deck = Deck()
+        for _ in range(10):
+            deck.draw_card()
+        deck.reset()
+        card_strings = set(str(card) for card in deck.cards)
+        self.assertEqual(len(card_strings), 52)
+    
     def test_deck_is_shuffled(self):
         """Test that deck is shuffled (cards in different order)."""
         deck1 = Deck()
@@ -78,5 +87,37 @@ class TestDeck(unittest.TestCase):
         self.assertNotEqual(deck1_order, deck2_order)
 
 
+class TestAnimatedCard(unittest.TestCase):
+    """Test cases for the AnimatedCard class."""
+    
+    def test_animation_ends_at_target(self):
+        """Test that a finished animation is at its end position and face up."""
+        anim = AnimatedCard(Card(Suit.HEARTS, Rank.ACE), 850, 250, 50, 200, duration=30)
+        for _ in range(30):
+            anim.update()
+        self.assertTrue(anim.is_complete())
+        self.assertEqual(anim.get_position(), (50, 200))
+        self.assertEqual(anim.flip_angle, 0)
+    
+    def test_animation_to_deck_ends_face_down(self):
+        """Test that a card animated back to the deck ends face down."""
+        anim = AnimatedCard(Card(Suit.CLUBS, Rank.TEN), 50, 200, 850, 250,
+                            duration=10, to_deck=True)
+        self.assertEqual(anim.get_position(), (50, 200))
+        for _ in range(10):
+            anim.update()
+        self.assertEqual(anim.get_position(), (850, 250))
+        self.assertEqual(anim.flip_angle, 180)
+    
+    def test_update_past_completion(self):
+        """Test that updating a finished animation keeps it at its end state."""
+        anim = AnimatedCard(Card(Suit.SPADES, Rank.TWO), 850, 250, 50, 200, duration=30)
+        for _ in range(35):
+            anim.update()
+        self.assertTrue(anim.is_complete())
+        self.assertEqual(anim.get_position(), (50, 200))
+        self.assertEqual(anim.flip_angle, 0)
+
+
 if __name__ == '__main__':
     unittest.main()